@@ -1,5 +1,6 @@
 from .saga import (
     SAGA,
+    SAGASession,
     Library,
     Tool,
     )
@@ -12,6 +13,7 @@ from .objects import (
 
 __all__ = [
     'SAGA',
+    'SAGASession',
     'Library',
     'Tool',
     'Raster',
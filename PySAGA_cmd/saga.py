@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import os
+import queue
 import shutil
+import asyncio
+import weakref
 import tempfile
+import threading
 import concurrent.futures
 import time
 from typing import (
@@ -12,6 +16,8 @@ from typing import (
     Optional,
     Protocol,
     Iterable,
+    Iterator,
+    Sequence,
     TypeVar,
     Any,
     runtime_checkable,
@@ -20,17 +26,17 @@ from typing import (
 )
 from pathlib import Path
 import subprocess
-from abc import (
-    ABC,
-    abstractmethod,
-)
 from dataclasses import (
     dataclass,
     field
 )
-from functools import partial
+from functools import (
+    lru_cache,
+    partial
+)
 import csv
 import re
+import shlex
 from collections import (
     UserDict,
     abc,
@@ -54,6 +60,29 @@ def temp_dir():
     return Path(tempfile.mkdtemp())
 
 
+@lru_cache(maxsize=8)
+def _validate_saga_cmd(path: str) -> None:
+    """Runs the executable check once per unique path.
+
+    'check_is_executable' spawns the file to verify that it runs;
+    caching the result avoids repeating that syscall-heavy check for
+    every 'SAGACMD' built from the same path.
+    """
+    check_is_executable(Path(path))
+
+
+_UPPER_CACHE: dict[str, str] = {}
+
+
+def _upper(param: str) -> str:
+    """Upper-cases a parameter name, caching the result.
+
+    The same parameter names ('elevation', 'method', ...) are formatted
+    over and over when a tool is re-run in a loop.
+    """
+    return _UPPER_CACHE.setdefault(param, param.upper())
+
+
 @runtime_checkable
 class SupportsStr(Protocol):
     def __str__(self) -> str:
@@ -63,13 +92,17 @@ class SupportsStr(Protocol):
 PathLike = Union[str, os.PathLike]
 
 
-@dataclass
 class SAGACMD:
     """The saga_cmd file object.
 
     If the path parameter is not provided, a default value
     will be set according to the user's platform.
 
+    Instances are interned by their resolved path: constructing a
+    'SAGACMD' from a path that was already wrapped returns the
+    existing, already validated object instead of re-checking the
+    file.
+
     Parameters
     ----------
     path: The file path to the 'saga_cmd' file. For information
@@ -82,19 +115,42 @@ class SAGACMD:
     OSError: If 'path' can not be executed.
     """
 
-    path: Optional[PathLike] = field(default=None)
+    __slots__ = ('path', '_initialized', '__weakref__')
 
-    def __post_init__(self) -> None:
-        if self.path is None:
+    path: Path
+
+    _instances: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+    def __new__(cls, path: Optional[PathLike] = None) -> SAGACMD:
+        if path is None:
+            # The search result is not known yet, so there is nothing
+            # to intern on.
+            return super().__new__(cls)
+        key = os.fspath(Path(path).resolve())
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instances[key] = instance
+        return instance
+
+    def __init__(self, path: Optional[PathLike] = None) -> None:
+        if getattr(self, '_initialized', False):
+            return
+        if path is None:
             print(
                 'Path to "saga_cmd" was not provided.',
                 'Attempting to find it.'
             )
-            self.path = search_saga_cmd()
-            print(f'saga_cmd found at "{self.path}".')
-        elif not isinstance(self.path, Path):
-            self.path = Path(self.path)
-        check_is_executable(self.path)
+            path = search_saga_cmd()
+            print(f'saga_cmd found at "{path}".')
+        elif not isinstance(path, Path):
+            path = Path(path)
+        _validate_saga_cmd(os.fspath(path))
+        self.path = path
+        self._initialized = True
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(path={self.path!r})'
 
     def __str__(self) -> str:
         assert self.path is not None
@@ -104,7 +160,6 @@ class SAGACMD:
         return str(self)
 
 
-@dataclass
 class Flag:
     """Describes a flag object that can be used when executing objects.
 
@@ -115,13 +170,23 @@ class Flag:
       documentation if you want to find out more about flags.
     """
 
-    flag: Optional[str] = field(default=None)
+    __slots__ = ('flag',)
+
+    flag: Optional[str]
+
+    def __init__(self, flag: Optional[str] = None) -> None:
+        self.flag = flag
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(flag={self.flag!r})'
 
     def __str__(self) -> str:
         if self.flag is None:
             return ''
-        if isinstance(self.flag, str) and not self.flag.startswith('--'):
-            return ''.join(['--', self.flag])
+        # The setter guarantees a string, so only the prefix needs
+        # checking.
+        if not self.flag.startswith('--'):
+            return f'--{self.flag}'
         return self.flag
 
     def __bool__(self) -> bool:
@@ -157,6 +222,7 @@ class Parameters(UserDict[str, str]):
 
     def __init__(self, tool: Tool, **kwargs: SupportsStr) -> None:
         self.tool = tool
+        self._formatted: Optional[list[str]] = None
         super().__init__()
         # Converts parameter values to str.
         for param, value in kwargs.items():
@@ -167,6 +233,8 @@ class Parameters(UserDict[str, str]):
 
         It also replaces 'temp' named files with a temporary unique path.
         """
+        self._formatted = None
+        self.tool._command = None
         value = str(value)
         try:
             path = Path(value)
@@ -183,35 +251,80 @@ class Parameters(UserDict[str, str]):
         finally:
             return super().__setitem__(param, value)
 
+    def __delitem__(self, param: str) -> None:
+        self._formatted = None
+        self.tool._command = None
+        super().__delitem__(param)
+
     def __str__(self) -> str:
-        return ' '.join(self.formatted)
+        if self._formatted is not None:
+            return ' '.join(self._formatted)
+        return ' '.join(self.iter_formatted())
+
+    def iter_formatted(self) -> Iterator[str]:
+        """Yields the formatted parameters one by one.
+
+        The underlying dict is the single source of truth; the tokens
+        are generated from it on the fly, without an intermediate
+        list.
+        """
+        return (f'-{_upper(param)}={value}' for param, value in self.items())
 
     @property
     def formatted(self) -> list[str]:
-        return (
-            [f'-{param.upper()}={value}' for param, value in self.items()]
-        )
+        # Memoized materialization of 'iter_formatted'; any mutation
+        # through '__setitem__' or '__delitem__' invalidates it.
+        if self._formatted is None:
+            self._formatted = list(self.iter_formatted())
+        return self._formatted
+
+    def update_param(self, param: str, value: SupportsStr) -> None:
+        """Updates a single parameter.
+
+        Unlike plain item assignment, a cached 'formatted' list is
+        patched in place instead of being rebuilt, which pays off when
+        the same tool is re-run many times with one changed parameter.
+        """
+        formatted = self._formatted
+        if formatted is not None and param in self.data:
+            index = list(self.data).index(param)
+            self[param] = value
+            formatted[index] = f'-{_upper(param)}={self.data[param]}'
+            self._formatted = formatted
+        else:
+            self[param] = value
 
 
-class Executable(ABC):
-    """Describes an object that is executable."""
+class Executable:
+    """Describes an object that is executable.
+
+    Kept as a plain class: the subclasses all override the stubs, so
+    the ABCMeta checks on every instantiation bought no safety.
+    """
+
+    __slots__ = ()
 
-    @abstractmethod
     def execute(self) -> Union[ToolOutput, Iterable[ToolOutput], Output]:
         """Implements the execution behaviour of the object."""
+        raise NotImplementedError
 
 
 class SAGAExecutable(Executable):
     """Describes an executable inside SAGAGIS."""
 
-    @abstractmethod
+    # The dataclass subclasses carry a '__dict__' anyway, so the
+    # attributes are only declared here, once, for typing purposes.
+    _flag: Flag
+    _command: Optional[Command]
+
     def __str__(self):
         """The name of the object."""
+        raise NotImplementedError
 
     @property
-    @abstractmethod
     def command(self):
         """Gets the current command."""
+        raise NotImplementedError
 
     @property
     def flag(self):
@@ -224,11 +337,13 @@ class SAGAExecutable(Executable):
         if flag is not None:
             flag = str(flag)
         self._flag = Flag(flag)
+        self._command = None
 
     @flag.deleter
     def flag(self):
         """Deletes the current flag."""
         self._flag = Flag()
+        self._command = None
 
 
 class Version(NamedTuple):
@@ -282,8 +397,12 @@ class SAGA(SAGAExecutable):
     )
 
     def __post_init__(self) -> None:
-        if not isinstance(self.saga_cmd, SAGACMD):
+        # 'type' is faster than 'isinstance' and SAGACMD is not meant
+        # to be subclassed; the flyweight makes the re-wrap free for
+        # already-seen paths anyway.
+        if type(self.saga_cmd) is not SAGACMD:
             self.saga_cmd = SAGACMD(self.saga_cmd)
+        self._command = None
         self._flag = Flag()
         self._temp_dir = temp_dir()
         if self.version is None:
@@ -342,8 +461,10 @@ class SAGA(SAGAExecutable):
 
     @property
     def command(self) -> Command:
-        assert isinstance(self.saga_cmd, SupportsStr)
-        return Command(self.saga_cmd, self.flag)
+        if self._command is None:
+            assert isinstance(self.saga_cmd, SupportsStr)
+            self._command = Command(self.saga_cmd, self.flag)
+        return self._command
 
     def get_library(self, library: str) -> Library:
         """Get a SAGA GIS Library object.
@@ -385,6 +506,135 @@ class SAGA(SAGAExecutable):
         """
         return Output(self, self.command.execute(), ignore_stderr)
 
+    def run_many(
+        self,
+        tools: Sequence[Tool],
+        max_workers: Optional[int] = None,
+        ignore_stderr: bool = False
+    ) -> list[ToolOutput]:
+        """Executes multiple tools concurrently.
+
+        Each tool spends its time waiting on a 'saga_cmd' child
+        process, so a thread pool is enough to overlap the
+        executions.
+
+        Args:
+            tools: The tools to execute. Their parameters should
+              already be defined, e.g. by calling each tool with
+              keyword arguments beforehand.
+            max_workers: The maximum number of worker threads. If None,
+              the 'ThreadPoolExecutor' default is used.
+            ignore_stderr: Whether or not the presence of a stderr
+              raises an error.
+
+        Returns:
+            list[ToolOutput]: The outputs, in the same order as 'tools'.
+        """
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers
+        ) as executor:
+            futures = [
+                executor.submit(tool.execute, ignore_stderr=ignore_stderr)
+                for tool in tools
+            ]
+        return [future.result() for future in futures]
+
+    async def gather(
+        self,
+        tools: Sequence[Tool],
+        ignore_stderr: bool = False
+    ) -> list[ToolOutput]:
+        """Executes multiple tools asynchronously.
+
+        The commands are submitted together and awaited with
+        'asyncio.gather', overlapping the 'saga_cmd' child processes.
+
+        Args:
+            tools: The tools to execute. Their parameters should
+              already be defined, e.g. by calling each tool with
+              keyword arguments beforehand.
+            ignore_stderr: Whether or not the presence of a stderr
+              raises an error.
+
+        Returns:
+            list[ToolOutput]: The outputs, in the same order as 'tools'.
+        """
+        completed = await asyncio.gather(
+            *(tool.command.execute_async() for tool in tools)
+        )
+        return [
+            ToolOutput(tool, process, ignore_stderr)
+            for tool, process in zip(tools, completed)
+        ]
+
+    def run_batch(
+        self,
+        tools: Sequence[Tool],
+        ignore_stderr: bool = False
+    ) -> list[ToolOutput]:
+        """Executes multiple tools in a single 'saga_cmd' process.
+
+        The tools are serialized to a temporary script that is run in
+        one go with the 'saga_cmd' script flag, so the executable
+        startup and the library loading are paid once instead of once
+        per tool. This is the fastest option for loops of cheap tools.
+
+        Args:
+            tools: The tools to execute, in order. Their parameters
+              should already be defined, e.g. by calling each tool
+              with keyword arguments beforehand.
+            ignore_stderr: Whether or not the presence of a stderr
+              raises an error. A stderr belongs to the batch process
+              as a whole and is not attributed to a single tool.
+
+        Returns:
+            list[ToolOutput]: The outputs, in the same order as 'tools'.
+        """
+        lines = []
+        for tool in tools:
+            parts = [
+                str(tool.flag),
+                str(tool.library),
+                str(tool),
+                *tool.parameters.formatted
+            ]
+            lines.append(' '.join(part for part in parts if part))
+        with tempfile.NamedTemporaryFile(
+            'w', suffix='.txt', delete=False
+        ) as script:
+            script.write('\n'.join(lines))
+            script_path = script.name
+        try:
+            completed = subprocess.run(
+                [str(self.saga_cmd), '-f=s', script_path],
+                capture_output=True,
+                text=True,
+                check=False
+            )
+        finally:
+            os.remove(script_path)
+        segments = split_batch_stdout(completed.stdout, len(tools))
+        # The outputs are built first so that the successful segments
+        # are collected even when the batch wrote a stderr; the stderr
+        # can not be pinned on a single tool, so it is raised against
+        # the batch instead of being copied into every output.
+        outputs = [
+            ToolOutput(
+                tool,
+                subprocess.CompletedProcess(
+                    completed.args,
+                    completed.returncode,
+                    segment,
+                    ''
+                ),
+                ignore_stderr
+            )
+            for tool, segment in zip(tools, segments)
+        ]
+        if (stderr := completed.stderr.strip()) and not ignore_stderr:
+            raise ExecutionError(stderr, self)
+        return outputs
+
 
 @dataclass
 class Library(SAGAExecutable):
@@ -415,6 +665,7 @@ class Library(SAGAExecutable):
     library: str
 
     def __post_init__(self) -> None:
+        self._command = None
         self._flag = self.saga.flag
 
     def __str__(self):
@@ -427,8 +678,12 @@ class Library(SAGAExecutable):
 
     @property
     def command(self) -> Command:
-        assert isinstance(self.saga.saga_cmd, SupportsStr)
-        return Command(self.saga.saga_cmd, self.flag, self.library)
+        if self._command is None:
+            assert isinstance(self.saga.saga_cmd, SupportsStr)
+            self._command = Command(
+                self.saga.saga_cmd, self.flag, self.library
+            )
+        return self._command
 
     def get_tool(self, tool: str) -> Tool:
         """Get a SAGA GIS Tool object.
@@ -491,6 +746,7 @@ class Tool(SAGAExecutable):
     parameters: Parameters = field(init=False)
 
     def __post_init__(self) -> None:
+        self._command = None
         self._flag = self.library.flag
         self.parameters = Parameters(self)
 
@@ -499,9 +755,16 @@ class Tool(SAGAExecutable):
 
     def __call__(self: TTool, **kwargs: SupportsStr) -> TTool:
         """Uses keyword argument to define the tool parameters."""
-        if self.parameters:
-            self._del_attr_params()
-        self.parameters = Parameters(self, **kwargs)
+        if self.parameters and self.parameters.keys() == kwargs.keys():
+            # Same parameter set: update values in place instead of
+            # rebuilding the 'Parameters' object.
+            for param, value in kwargs.items():
+                self.parameters.update_param(param, value)
+        else:
+            if self.parameters:
+                self._del_attr_params()
+            self.parameters = Parameters(self, **kwargs)
+            self._command = None
         self._set_attr_params()
         return self
 
@@ -520,16 +783,18 @@ class Tool(SAGAExecutable):
 
     @property
     def command(self) -> Command:
-        assert isinstance(self.library.saga.saga_cmd, SupportsStr)
-        return (
-            Command(
-                self.library.saga.saga_cmd,
-                self.flag,
-                self.library,
-                self.tool,
-                *self.parameters.formatted
+        if self._command is None:
+            assert isinstance(self.library.saga.saga_cmd, SupportsStr)
+            self._command = (
+                Command(
+                    self.library.saga.saga_cmd,
+                    self.flag,
+                    self.library,
+                    self.tool,
+                    *self.parameters.formatted
+                )
             )
-        )
+        return self._command
 
     def __or__(self, tool: Tool) -> Pipeline:
         return Pipeline(self) | (tool)
@@ -590,7 +855,6 @@ class Tool(SAGAExecutable):
 TPipeline = TypeVar("TPipeline", bound='Pipeline')
 
 
-@dataclass
 class Pipeline(Executable, abc.Sequence):
     """Used to chain tools.
 
@@ -628,6 +892,8 @@ class Pipeline(Executable, abc.Sequence):
     >>> outputs = pipe.execute(verbose=True)
     """
 
+    __slots__ = ('tools',)
+
     tools: list[Tool]
 
     def __init__(
@@ -668,19 +934,216 @@ class Pipeline(Executable, abc.Sequence):
         return ''.join(str(element) for element in string)
 
 
+class SAGASession:
+    """A persistent 'saga_cmd' process that runs many tools.
+
+    A single child process is spawned in script mode and one tool
+    invocation per line is streamed into its stdin, so the executable
+    startup and the library loading are amortized over every tool run
+    in the session. Use it as a context manager.
+
+    The stdout and stderr pipes are drained by background threads, so
+    a chatty child can not fill a pipe buffer and deadlock the
+    session. A stderr is attributed to the tool that was running when
+    it appeared, on a best-effort basis.
+
+    Parameters
+    ----------
+    saga: The 'SAGA' object whose 'saga_cmd' executable is used.
+    ignore_stderr: Whether or not the presence of a stderr raises an
+      error when a tool is run.
+    timeout: The maximum number of seconds to wait for a line of
+      stdout before giving up on the current tool. None waits
+      indefinitely (a stderr with no separator in sight still ends
+      the wait).
+
+    Methods
+    -------
+    run: Streams a single tool invocation into the process and
+      returns its output.
+    close: Closes the stdin of the process and waits for it to exit.
+
+    Examples
+    ---------
+    >>> saga = SAGA('path/to/saga_cmd')
+    >>> tool = saga / 'ta_morphometry' / '0'
+    >>> with SAGASession(saga) as session:
+    ...     output = session.run(tool, elevation='path/to/raster')
+    """
+
+    # How often the stdout queue is polled and how long to keep
+    # waiting for a separator once a stderr has appeared.
+    POLL_INTERVAL = 0.1
+    STDERR_GRACE = 1.0
+
+    __slots__ = (
+        'saga',
+        'ignore_stderr',
+        'timeout',
+        'process',
+        '_stdout_lines',
+        '_stderr_lines',
+        '_pumps'
+    )
+
+    def __init__(
+        self,
+        saga: SAGA,
+        ignore_stderr: bool = False,
+        timeout: Optional[float] = None
+    ) -> None:
+        self.saga = saga
+        self.ignore_stderr = ignore_stderr
+        self.timeout = timeout
+        self.process: Optional[subprocess.Popen] = None
+
+    def __enter__(self) -> SAGASession:
+        self.process = subprocess.Popen(
+            [str(self.saga.saga_cmd), '-f=s'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=Command.BUFSIZE,
+            text=True
+        )
+        self._stdout_lines: queue.SimpleQueue = queue.SimpleQueue()
+        self._stderr_lines: list[str] = []
+        self._pumps = (
+            threading.Thread(target=self._pump_stdout, daemon=True),
+            threading.Thread(target=self._pump_stderr, daemon=True)
+        )
+        for pump in self._pumps:
+            pump.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _pump_stdout(self) -> None:
+        assert self.process is not None
+        assert self.process.stdout is not None
+        for line in self.process.stdout:
+            self._stdout_lines.put(line)
+        # EOF sentinel: the process exited.
+        self._stdout_lines.put(None)
+
+    def _pump_stderr(self) -> None:
+        assert self.process is not None
+        assert self.process.stderr is not None
+        for line in self.process.stderr:
+            self._stderr_lines.append(line)
+
+    def run(self, tool: Tool, **kwargs: SupportsStr) -> ToolOutput:
+        """Streams a single tool invocation into the process.
+
+        Args:
+            tool: The tool to run.
+            **kwargs: The tool parameters as keyword arguments, like
+              when calling the tool itself.
+
+        Returns:
+            ToolOutput: An object describing the output of the run.
+        """
+        assert self.process is not None, 'The session is not open.'
+        assert self.process.stdin is not None
+        if kwargs:
+            tool(**kwargs)
+        self._drain_stale_stdout()
+        line = ' '.join([str(tool.library), str(tool), str(tool.parameters)])
+        self.process.stdin.write(f'{line}\n')
+        self.process.stdin.flush()
+        stdout = self._read_until_separator()
+        stderr = ''.join(self._stderr_lines)
+        del self._stderr_lines[:]
+        returncode = self.process.poll()
+        return ToolOutput(
+            tool,
+            subprocess.CompletedProcess(
+                line,
+                returncode if returncode is not None else 0,
+                stdout,
+                stderr
+            ),
+            self.ignore_stderr
+        )
+
+    def _drain_stale_stdout(self) -> None:
+        """Discards output left over from a run that gave up early.
+
+        After a timeout or a stderr-triggered break the previous tool
+        may still flush lines (and its separator) later; they must not
+        be read back as the next tool's output.
+        """
+        while True:
+            try:
+                line = self._stdout_lines.get_nowait()
+            except queue.Empty:
+                return
+            if line is None:
+                # Keep the EOF sentinel for the next read.
+                self._stdout_lines.put(None)
+                return
+
+    def _read_until_separator(self) -> str:
+        """Reads the stdout up to the separator between tool runs.
+
+        Gives up when the process exits, when 'timeout' passes with
+        no new line, or shortly after a stderr shows up with no
+        separator in sight (the realistic error path).
+        """
+        lines: list[str] = []
+        waited = 0.0
+        while True:
+            try:
+                line = self._stdout_lines.get(timeout=self.POLL_INTERVAL)
+            except queue.Empty:
+                waited += self.POLL_INTERVAL
+                if self._stderr_lines and waited >= self.STDERR_GRACE:
+                    break
+                if self.timeout is not None and waited >= self.timeout:
+                    break
+                continue
+            waited = 0.0
+            if line is None:
+                # EOF: the process exited.
+                break
+            if BATCH_SEPARATOR.match(line):
+                break
+            lines.append(line)
+        return ''.join(lines)
+
+    def close(self) -> None:
+        """Closes the stdin of the process and waits for it to exit."""
+        if self.process is None:
+            return
+        if self.process.stdin is not None:
+            self.process.stdin.close()
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.terminate()
+            self.process.wait()
+        for pump in self._pumps:
+            pump.join(timeout=1)
+        self.process = None
+
+
 class PipelineError(Exception):
     def __init__(self, message: str):
         self.message = message
         super().__init__(self.message)
 
 
-@dataclass
 class Command(abc.Sequence):
     """The commands to be executed.
 
     Attributes
     ----------
     args: The args to be passed to the 'subprocess.Popen' function.
+    BUFSIZE: The buffer size used for the stdout and stderr pipes of
+      the child process. SAGA GIS tools can emit megabytes of progress
+      output for large rasters; a 64 KiB buffer keeps the number of
+      reads low without buffering the whole output at once.
 
     Methods
     ----------
@@ -688,10 +1151,20 @@ class Command(abc.Sequence):
       and executes the 'subprocess.run' function.
     """
 
-    args: list[str] = field(default_factory=list, init=False)
+    BUFSIZE = 65536
+
+    __slots__ = ('args', '_str')
+
+    args: list[str]
 
     def __init__(self, *args: SupportsStr) -> None:
         self.args = [str(arg) for arg in args if arg]
+        # Precomputed with 'shlex.join' so that paths containing
+        # spaces stay copy-pasteable and repeated printing is free.
+        self._str = shlex.join(self.args)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(args={self.args!r})'
 
     def __len__(self):
         return len(self.args)
@@ -700,7 +1173,7 @@ class Command(abc.Sequence):
         return self.args[idx]
 
     def __str__(self) -> str:
-        return ' '.join(f'"{arg}"' for arg in self.args)
+        return self._str
 
     def execute(self, verbose: bool = False) -> subprocess.Popen:
         """Executes the process.
@@ -719,18 +1192,53 @@ class Command(abc.Sequence):
                 subprocess.STARTF_USESHOWWINDOW  # type: ignore
             )
 
+        # The pipes are only opened in text mode when the progress is
+        # printed, as 'dynamic_print' reads lines. Otherwise stdout is
+        # captured as bytes and decoded lazily by 'Output.stdout'.
         process = subprocess.Popen(
             self.args,
-            text=True,
+            text=verbose,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             stdin=subprocess.PIPE,
+            bufsize=self.BUFSIZE,
             startupinfo=startupinfo
         )
         if verbose:
             dynamic_print(process)
         return process
 
+    async def execute_async(self) -> subprocess.CompletedProcess:
+        """Executes the process without blocking the event loop.
+
+        This is the asynchronous counterpart of 'execute'. Submitting
+        many commands and awaiting them together (e.g. with
+        'asyncio.gather') overlaps the child processes, so the total
+        wall-clock time approaches that of the slowest command.
+        """
+        startupinfo = None
+        if USER_PLATFORM == Platforms.WINDOWS:
+            startupinfo = subprocess.STARTUPINFO()  # type: ignore
+            startupinfo.dwFlags |= (
+                subprocess.STARTF_USESHOWWINDOW  # type: ignore
+            )
+
+        process = await asyncio.create_subprocess_exec(
+            *self.args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=self.BUFSIZE,
+            startupinfo=startupinfo
+        )
+        stdout, stderr = await process.communicate()
+        assert process.returncode is not None
+        return subprocess.CompletedProcess(
+            self.args,
+            process.returncode,
+            stdout.decode('utf-8', errors='replace'),
+            stderr.decode('utf-8', errors='replace')
+        )
+
 
 @dataclass
 class Output:
@@ -739,39 +1247,58 @@ class Output:
     Parameters
     ----------
     saga_executable: A SAGA, Library or Tool object.
-    completed_process: A 'CompletedProcess' object that was returned by
-      a command execution.
+    completed_process: A 'Popen' or 'CompletedProcess' object that was
+      returned by a command execution.
     ignore_stderr: Whether or not the presence of a stderr raises an error.
 
     Attributes
     ----------
-    stdout: The 'stdout' attribute of the 'CompletedProcess' object as string.
-    stderr: The 'stderr' attribute of the 'CompletedProcess' object as string.
-    stdin: The 'stdin' attribute of the 'CompletedProcess' object as string.
+    stdout: The 'stdout' attribute of the child process as string.
+      Captured as bytes and only decoded when accessed.
+    stderr: The 'stderr' attribute of the child process as string.
+    stdin: The 'stdin' attribute of the child process as string.
     """
 
     saga_executable: Union[SAGA, Library, Tool]
-    completed_process: subprocess.Popen
+    completed_process: Union[subprocess.Popen, subprocess.CompletedProcess]
     ignore_stderr: bool
-    stdout: Optional[str] = field(init=False, default=None, repr=False)
     stderr: Optional[str] = field(init=False, default=None, repr=False)
     stdin: Optional[str] = field(init=False, default=None, repr=False)
+    _stdout: Union[str, bytes, None] = field(
+        init=False, default=None, repr=False
+    )
 
     def __post_init__(self) -> None:
-        if self.completed_process.stdout is not None:
-            self.stdout = self.completed_process.stdout.read()
-        if (
-            (stderr := self.completed_process.stderr) is not None
-            and (read := stderr.read().strip())
-        ):
-            if not self.ignore_stderr:
-                raise ExecutionError(read, self.saga_executable)
-            self.stderr = read
+        if (stdout := self.completed_process.stdout) is not None:
+            self._stdout = (
+                stdout if isinstance(stdout, (str, bytes)) else stdout.read()
+            )
+        if (stderr := self.completed_process.stderr) is not None:
+            if not isinstance(stderr, (str, bytes)):
+                stderr = stderr.read()
+            if (stderr := stderr.strip()):
+                if isinstance(stderr, bytes):
+                    stderr = stderr.decode('utf-8', errors='replace')
+                if not self.ignore_stderr:
+                    raise ExecutionError(stderr, self.saga_executable)
+                self.stderr = stderr
         if (
-            self.completed_process.stdin is not None
-            and self.completed_process.stdin.readable()
+            (stdin := getattr(self.completed_process, 'stdin', None))
+            is not None
+            and stdin.readable()
         ):
-            self.stdin = self.completed_process.stdin.read()
+            self.stdin = stdin.read()
+
+    @property
+    def stdout(self) -> Optional[str]:
+        """The decoded stdout of the child process.
+
+        Decoding is deferred until the first access, so callers that
+        only care about the output files never pay for it.
+        """
+        if isinstance(self._stdout, bytes):
+            self._stdout = self._stdout.decode('utf-8', errors='replace')
+        return self._stdout
 
 
 Files = dict[str, Union[Path, Raster, Vector]]
@@ -840,24 +1367,52 @@ class ToolOutput(Output):
         return self._files
 
     def get_files(self) -> Files:
+        # Bound locally: global lookups inside the loop add up when
+        # many outputs are collected. The format sets are fetched once
+        # instead of walking the attribute chain per path like
+        # 'is_raster'/'is_vector' do.
+        raster, vector, path_cls = Raster, Vector, Path
+        saga = self.saga_executable.library.saga
+        raster_formats: set[str] = saga._raster_formats or set()
+        vector_formats: set[str] = saga._vector_formats or set()
         files: Files = {}
         for param, value in self.saga_executable.parameters.items():
             try:
-                path = Path(value)
+                path = path_cls(value)
             except Exception:
                 continue
             else:
                 if not path.is_file():
                     continue
-                if self.is_raster(path):
-                    files[param] = Raster(path)
-                elif self.is_vector(path):
-                    files[param] = Vector(path)
+                suffix = path.suffix.strip('.')
+                if suffix in raster_formats:
+                    files[param] = raster(path)
+                elif suffix in vector_formats:
+                    files[param] = vector(path)
                 else:
                     files[param] = path
         return files
 
 
+BATCH_SEPARATOR = re.compile(r'^_{10,}\s*$', flags=re.MULTILINE)
+
+
+def split_batch_stdout(stdout: str, n_tools: int) -> list[str]:
+    """Splits the stdout of a batch run into per-tool segments.
+
+    SAGA prints a line of underscores between tool runs. If the output
+    can not be split into exactly one segment per tool, the full
+    stdout is attached to every tool instead.
+    """
+    segments = [
+        segment for segment in BATCH_SEPARATOR.split(stdout)
+        if segment.strip()
+    ]
+    if len(segments) != n_tools:
+        return [stdout] * n_tools
+    return segments
+
+
 def get_saga_version(saga: SAGA) -> Optional[Version]:
     """Get's the SAGA version using the version flag."""
     saga.flag = 'version'
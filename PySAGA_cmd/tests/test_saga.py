@@ -1,3 +1,4 @@
+import shlex
 from pathlib import Path
 
 from PySAGA_cmd.saga import (
@@ -19,38 +20,27 @@ class TestSAGA:
     def test_get_library(self):
         library = 'ta_morphometry'
         lib = SAGA_.get_library(library=library)
-        command = ' '.join([f'"{SAGA_.saga_cmd}"', f'"{library}"'])
+        command = shlex.join([str(SAGA_.saga_cmd), library])
         assert str(lib.command) == command
 
     def test_get_library_div(self):
         lib_name = 'ta_morphometry'
         library_div = SAGA_ / lib_name
-        command = ' '.join(
-            [f'"{SAGA_.saga_cmd}"',
-             f'"{lib_name}"']
-        )
+        command = shlex.join([str(SAGA_.saga_cmd), lib_name])
         assert str(library_div.command) == command
 
     def test_get_tool(self):
         lib_name = 'ta_morphometry'
         tool_name = '0'
         tool = SAGA_.get_tool(library=lib_name, tool=tool_name)
-        command = ' '.join(
-            [f'"{SAGA_.saga_cmd}"',
-             f'"{lib_name}"',
-             f'"{tool_name}"']
-        )
+        command = shlex.join([str(SAGA_.saga_cmd), lib_name, tool_name])
         assert str(tool.command) == command
 
     def test_get_tool_div(self):
         lib_name = 'ta_morphometry'
         tool_name = '0'
         tool_div = SAGA_ / lib_name / tool_name
-        command = ' '.join(
-            [f'"{SAGA_.saga_cmd}"',
-             f'"{lib_name}"',
-             f'"{tool_name}"']
-        )
+        command = shlex.join([str(SAGA_.saga_cmd), lib_name, tool_name])
         assert str(tool_div.command) == command
 
     def test_flag(self):
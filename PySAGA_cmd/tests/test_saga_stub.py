@@ -0,0 +1,208 @@
+import sys
+import shlex
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from PySAGA_cmd.saga import (
+    SAGA,
+    SAGACMD,
+    SAGASession,
+    Command,
+    ExecutionError,
+    Version,
+    split_batch_stdout
+)
+
+
+# These tests run against stub saga_cmd scripts, so they do not need
+# a SAGA GIS installation.
+pytestmark = pytest.mark.skipif(
+    sys.platform.startswith('win'),
+    reason='The stub saga_cmd executables are shell scripts.'
+)
+
+
+SEPARATOR = '____________'
+
+
+def make_stub(directory: Path, body: str) -> Path:
+    stub = directory / 'saga_cmd'
+    stub.write_text(f'#!/bin/sh\n{body}\n')
+    stub.chmod(0o755)
+    return stub
+
+
+def make_saga(directory: Path, body: str) -> SAGA:
+    saga = SAGA(make_stub(directory, body), version=Version(9, 3, 1))
+    # Pre-set the formats so that the 'GDAL Formats' tool of a real
+    # SAGA GIS install is never invoked.
+    saga._raster_formats = set()
+    saga._vector_formats = set()
+    return saga
+
+
+@pytest.fixture
+def saga(tmp_path: Path) -> SAGA:
+    return make_saga(tmp_path, 'echo "output for: $@"')
+
+
+class TestSplitBatchStdout:
+
+    def test_split(self):
+        stdout = f'tool one\n{SEPARATOR}\ntool two\n'
+        segments = split_batch_stdout(stdout, 2)
+        assert len(segments) == 2
+        assert 'tool one' in segments[0]
+        assert 'tool two' in segments[1]
+
+    def test_fallback(self):
+        segments = split_batch_stdout('garbled', 3)
+        assert segments == ['garbled'] * 3
+
+
+class TestCommand:
+
+    def test_str_quotes_spaces(self, tmp_path: Path):
+        spaced = tmp_path / 'with space'
+        spaced.mkdir()
+        command = Command(spaced / 'saga_cmd', 'lib', '0')
+        assert str(command) == shlex.join(command.args)
+        assert shlex.split(str(command)) == command.args
+
+    def test_str_precomputed(self):
+        command = Command('saga_cmd', 'lib')
+        assert str(command) is str(command)
+
+
+class TestSAGACMDFlyweight:
+
+    def test_same_path_same_instance(self, tmp_path: Path):
+        stub = make_stub(tmp_path, 'echo stub')
+        assert SAGACMD(stub) is SAGACMD(str(stub))
+
+    def test_different_paths_different_instances(self, tmp_path: Path):
+        first = make_stub(tmp_path, 'echo stub')
+        other_dir = tmp_path / 'other'
+        other_dir.mkdir()
+        second = make_stub(other_dir, 'echo stub')
+        assert SAGACMD(first) is not SAGACMD(second)
+
+
+class TestParametersCache:
+
+    def test_formatted_is_cached(self, saga: SAGA):
+        tool = (saga / 'lib' / '0')(elevation='a.tif', method=0)
+        params = tool.parameters
+        formatted = params.formatted
+        assert formatted is params.formatted
+        params['method'] = 1
+        assert params.formatted == ['-ELEVATION=a.tif', '-METHOD=1']
+
+    def test_update_param_patches_in_place(self, saga: SAGA):
+        tool = (saga / 'lib' / '0')(elevation='a.tif', method=0)
+        params = tool.parameters
+        formatted = params.formatted
+        params.update_param('elevation', 'b.tif')
+        assert params.formatted is formatted
+        assert formatted == ['-ELEVATION=b.tif', '-METHOD=0']
+
+    def test_call_with_same_keys_reuses_parameters(self, saga: SAGA):
+        tool = (saga / 'lib' / '0')(elevation='a.tif')
+        params = tool.parameters
+        tool(elevation='b.tif')
+        assert tool.parameters is params
+        assert tool.parameters['elevation'] == 'b.tif'
+
+
+class TestExecutionAPIs:
+
+    def test_run_many(self, saga: SAGA):
+        tools = [
+            (saga / 'lib' / '0')(a=1),
+            (saga / 'lib' / '1')(b=2)
+        ]
+        outputs = saga.run_many(tools, ignore_stderr=True)
+        assert len(outputs) == 2
+        assert outputs[0].stdout is not None
+        assert outputs[1].stdout is not None
+        assert 'lib 0' in outputs[0].stdout
+        assert 'lib 1' in outputs[1].stdout
+
+    def test_gather(self, saga: SAGA):
+        tools = [
+            (saga / 'lib' / '0')(a=1),
+            (saga / 'lib' / '1')(b=2)
+        ]
+        outputs = asyncio.run(saga.gather(tools, ignore_stderr=True))
+        assert len(outputs) == 2
+        assert outputs[0].stdout is not None
+        assert outputs[1].stdout is not None
+        assert 'lib 0' in outputs[0].stdout
+        assert 'lib 1' in outputs[1].stdout
+
+    def test_execute_async_replaces_undecodable_bytes(self, tmp_path: Path):
+        stub = make_stub(tmp_path, 'printf "\\377\\376ok"')
+        completed = asyncio.run(Command(stub).execute_async())
+        assert 'ok' in completed.stdout
+        assert '�' in completed.stdout
+
+    def test_run_batch(self, tmp_path: Path):
+        saga = make_saga(
+            tmp_path,
+            f'echo "tool one"\necho "{SEPARATOR}"\necho "tool two"'
+        )
+        tools = [
+            (saga / 'lib' / '0')(a=1),
+            (saga / 'lib' / '1')(b=2)
+        ]
+        outputs = saga.run_batch(tools)
+        assert len(outputs) == 2
+        assert outputs[0].stdout is not None
+        assert outputs[1].stdout is not None
+        assert 'tool one' in outputs[0].stdout
+        assert 'tool two' in outputs[1].stdout
+
+    def test_run_batch_stderr_blames_the_batch(self, tmp_path: Path):
+        saga = make_saga(tmp_path, 'echo "boom" >&2')
+        tools = [
+            (saga / 'lib' / '0')(a=1),
+            (saga / 'lib' / '1')(b=2)
+        ]
+        with pytest.raises(ExecutionError, match='boom'):
+            saga.run_batch(tools)
+        outputs = saga.run_batch(tools, ignore_stderr=True)
+        assert len(outputs) == 2
+        assert all(output.stderr is None for output in outputs)
+
+
+class TestSAGASession:
+
+    def test_run(self, tmp_path: Path):
+        saga = make_saga(
+            tmp_path,
+            'while read line; do\n'
+            '  echo "ran: $line"\n'
+            f'  echo "{SEPARATOR}"\n'
+            'done'
+        )
+        tool = saga / 'lib' / '0'
+        with SAGASession(saga, ignore_stderr=True) as session:
+            first = session.run(tool, elevation='a.tif')
+            second = session.run(tool, elevation='b.tif')
+        assert first.stdout is not None
+        assert second.stdout is not None
+        assert first.stdout.strip() == 'ran: lib 0 -ELEVATION=a.tif'
+        assert second.stdout.strip() == 'ran: lib 0 -ELEVATION=b.tif'
+        assert session.process is None
+
+    def test_stderr_raises_without_separator(self, tmp_path: Path):
+        saga = make_saga(
+            tmp_path,
+            'while read line; do\n  echo "bad tool" >&2\ndone'
+        )
+        tool = saga / 'lib' / '0'
+        with pytest.raises(ExecutionError, match='bad tool'):
+            with SAGASession(saga) as session:
+                session.run(tool, a=1)